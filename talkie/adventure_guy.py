@@ -1,7 +1,10 @@
+from logging import getLogger
 from typing import Final
 
 from pixtools import OpenAIClient
 
+logger = getLogger(__name__)
+
 
 class AdventureGuy:
     def __init__(self, open_ai_client: OpenAIClient, prompt: str = ""):
@@ -59,5 +62,5 @@ class AdventureGuy:
         """
         Set the part of the text that describes the current location or interaction. Should not include technical information, logging, or current score and move counters.
         """
-        print(f"VERBAL: {text}")
+        logger.debug(f"VERBAL: {text}")
         self.texts.append(text)
@@ -10,7 +10,7 @@ from pixtools.voice_recorder import VoiceToText
 from .adventure_guy import AdventureGuy
 from .if_player import IFPlayer
 from .talkie_config import TalkieConfig
-from .tts_chunk import split_for_tts
+from .tts_chunk import pack_paragraphs_for_tts
 
 
 @dataclass
@@ -91,20 +91,24 @@ class AIPlayer:
 
             # Process paragraphs for TTS or image lookup
             sections = self.desc.split("\n\n")
+            paragraphs: list[str] = []
             for text in sections:
                 text = text.strip()
                 if len(text) == 0:
                     continue
+                paragraphs.append(text)
                 if self.image_gen:
                     image_file = self.image_gen.get_image(text)
                     logging.info(f"'{text}' gave image {image_file}")
                     if image_file and not first_image_file:
                         first_image_file = image_file
                         self.output.append(ImageOutput(image_file))
-                if self.tts:
-                    chunks = split_for_tts(text, max_chars=400)
-                    for chunk in chunks:
-                        self.tts.speak(chunk)
+            if self.tts:
+                # Short paragraphs share a request, but chunks always end on
+                # paragraph boundaries so cached audio stays reusable
+                chunks = pack_paragraphs_for_tts(paragraphs, max_chars=400)
+                for chunk in chunks:
+                    self.tts.speak(chunk)
 
     def get_next_output(self) -> AIOutput | None:
         if len(self.output) == 0:
@@ -6,7 +6,7 @@ Bitmap drawing utilities using a simple 1D pixel buffer.
 `y * w + x`.
 """
 
-import array
+import re
 from collections.abc import Sequence
 from typing import Final
 
@@ -19,7 +19,7 @@ class PixelCanvas:
     """
 
     def __init__(self, w: int, h: int) -> None:
-        self.array: Final = array.array("B", [0] * w * h)
+        self.array: Final = bytearray(w * h)
         self.width: int = w
         self.height: int = h
 
@@ -30,8 +30,8 @@ class PixelCanvas:
         return y * self.width + x
 
     def clear(self, color: int):
-        for i in range(len(self.array)):
-            self.array[i] = color
+        # Slice assignment of a same-sized buffer is a single memcpy
+        self.array[:] = bytes((color,)) * len(self.array)
 
     def set_pixels(self, pixels: Sequence[int]):
         for i in range(len(self.array)):
@@ -42,7 +42,9 @@ class PixelCanvas:
 
         - Fills region containing (x, y) with color `col`
         - Only fills pixels that currently have color `target_col`
-        - Uses stack-based scanline approach for efficiency
+        - Uses stack-based scanline approach for efficiency: each span is
+          filled with one slice write and only one seed is pushed per run of
+          `target_col` pixels on the neighbouring rows
         """
 
         if col == target_col:
@@ -54,45 +56,35 @@ class PixelCanvas:
         if self.array[self._index(x, y)] != target_col:
             return
 
-        stack: list[tuple[int, int]] = [(x, y)]
+        buf = self.array
+        w, h = self.width, self.height
+        fill = bytes((col,))
+        target = bytes((target_col,))
+        # Scanning for runs of `target_col` is done by the regex engine in C
+        run = re.compile(re.escape(target) + b"+")
 
-        while stack:
-            cx, cy = stack.pop()
+        # Seeds are stored as packed buffer indices (y * w + x)
+        stack: list[int] = [y * w + x]
 
-            if not self._in_bounds(cx, cy):
-                continue
+        while stack:
+            seed = stack.pop()
+            row = seed - seed % w
 
-            if self.array[self._index(cx, cy)] != target_col:
+            # Find the extent of the span and fill it in one slice assignment
+            span = run.match(buf, seed, row + w)
+            if span is None:
+                # Already filled through another seed on the same span
                 continue
+            left = row + len(buf[row:seed].rstrip(target))
+            right = span.end()
+            buf[left:right] = fill * (right - left)
 
-            # Find left side, filling along the way
-            left = cx
-            while left >= 0 and self.array[self._index(left, cy)] == target_col:
-                self.array[self._index(left, cy)] = col
-                left -= 1
-
-            left += 1
-
-            # Find right side, filling along the way
-            right = cx + 1
-            while (
-                right < self.width and self.array[self._index(right, cy)] == target_col
-            ):
-                self.array[self._index(right, cy)] = col
-                right += 1
-
-            right -= 1
-
-            # Add spans above and below to stack
-            for i in range(left, right + 1):
-                if cy - 1 >= 0 and self.array[self._index(i, cy - 1)] == target_col:
-                    stack.append((i, cy - 1))
-
-                if (
-                    cy + 1 < self.height
-                    and self.array[self._index(i, cy + 1)] == target_col
-                ):
-                    stack.append((i, cy + 1))
+            # Push one seed per run of target pixels above and below the span
+            for offset in (-w, w):
+                if not 0 <= row + offset < w * h:
+                    continue
+                for m in run.finditer(buf, left + offset, right + offset):
+                    stack.append(m.start())
 
     def draw_line(
         self, x0: int, y0: int, x1: int, y1: int, col: int, target_color: int = -1
@@ -102,17 +94,60 @@ class PixelCanvas:
         - Writes only to in-bounds pixels.
         """
 
+        # Hoist attribute lookups out of the per-pixel loop
+        buf = self.array
+        w, h = self.width, self.height
+
+        # Unconditional horizontal and vertical lines are written as one
+        # (strided) slice assignment, clipped to the canvas
+        if target_color == -1 and (y0 == y1 or x0 == x1):
+            if y0 == y1:
+                a, b = max(min(x0, x1), 0), min(max(x0, x1), w - 1)
+                if 0 <= y0 < h and a <= b:
+                    buf[y0 * w + a : y0 * w + b + 1] = bytes((col,)) * (b - a + 1)
+            else:
+                a, b = max(min(y0, y1), 0), min(max(y0, y1), h - 1)
+                if 0 <= x0 < w and a <= b:
+                    buf[a * w + x0 : b * w + x0 + 1 : w] = bytes((col,)) * (b - a + 1)
+            return
+
+        # The line never leaves the bounding box of its end points, so it is
+        # invisible if both lie beyond the same edge
+        if (x0 < 0 and x1 < 0) or (y0 < 0 and y1 < 0):
+            return
+        if (x0 >= w and x1 >= w) or (y0 >= h and y1 >= h):
+            return
+
         dx = abs(x1 - x0)
         sx = 1 if x0 < x1 else -1
         dy = -abs(y1 - y0)
         sy = 1 if y0 < y1 else -1
         err = dx + dy  # error term
 
+        # With both end points on the canvas every pixel is, so step the
+        # buffer index directly without per-pixel bounds checks
+        if 0 <= x0 < w and 0 <= y0 < h and 0 <= x1 < w and 0 <= y1 < h:
+            i, end = y0 * w + x0, y1 * w + x1
+            step_y = sy * w
+            while True:
+                if target_color == -1 or target_color == buf[i]:
+                    buf[i] = col
+                if i == end:
+                    break
+                e2 = 2 * err
+                if e2 >= dy:
+                    err += dy
+                    i += sx
+                if e2 <= dx:
+                    err += dx
+                    i += step_y
+            return
+
         while True:
-            if self._in_bounds(x0, y0):
-                current = self.array[self._index(x0, y0)]
-                if target_color == -1 or target_color == current:
-                    self.array[self._index(x0, y0)] = col
+            if 0 <= x0 < w and 0 <= y0 < h:
+                i = y0 * w + x0
+                if target_color == -1 or target_color == buf[i]:
+                    buf[i] = col
             if x0 == x1 and y0 == y1:
                 break
             e2 = 2 * err
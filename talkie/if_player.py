@@ -51,7 +51,7 @@ class IFPlayer:
             args = [str(data / "magnetic"), file_name.as_posix()]
         else:
             raise RuntimeError("Unknown format")
-        print(args)
+        logger.debug(f"Starting interpreter: {args}")
 
         self.proc: Final = subprocess.Popen(
             args,
@@ -59,8 +59,8 @@ class IFPlayer:
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
         )
-        self.output_queue: queue.Queue[bytes] = queue.Queue()
-        self.input_queue: queue.Queue[bytes] = queue.Queue()
+        self.output_queue: queue.SimpleQueue[bytes] = queue.SimpleQueue()
+        self.input_queue: queue.SimpleQueue[bytes] = queue.SimpleQueue()
         self.last_write = time.time()
         self.transcript: list[tuple[str, str]] = []
         self.text_output: str = ""
@@ -152,7 +152,6 @@ class IFPlayer:
     def write(self, text: str):
         """Write text line to stdin of running interpreter."""
         self.input_queue.put(text.encode())
-        print(f"IN:'{text}'")
         logger.info(f"IN: '{text}'")
         self.transcript.append((">", text))
 
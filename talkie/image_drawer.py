@@ -47,18 +47,18 @@ class ImageDrawer:
         match cmd:
             case "img" if len(args) == 4:
                 no = args[0]
-                print(f"IMG {no}")
+                logger.debug(f"IMG {no}")
                 while len(self.bitmaps) <= no:
                     self.bitmaps.append(Bitmap(args[1], args[2]))
                 return False
             case "pal" if len(args) >= 1:
                 no = args[0]
-                print(f"PAL {no}")
+                logger.debug(f"PAL {no}")
                 self.bitmaps[no].palette = args[1:]
                 return False
             case "pixels" if len(args) >= 1:
                 no = args[0]
-                print(f"PIXELS {no}")
+                logger.debug(f"PIXELS {no}")
                 self.bitmaps[no].pixels = bytes(args[1:])
                 return False
             case "imgsize":
@@ -77,7 +77,7 @@ class ImageDrawer:
                 no = args[0]
                 if no >= len(self.bitmaps):
                     return False
-                print(f"BITMAP {no}")
+                logger.debug(f"BITMAP {no}")
                 # x, y = args[1], args[2]
                 bmp = self.bitmaps[no]
                 self.pcanvas = PixelCanvas(bmp.width, bmp.height)
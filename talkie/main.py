@@ -1,4 +1,5 @@
 #!/usr/bin/env python
+import copy
 import logging
 from dataclasses import dataclass
 from importlib import resources
@@ -8,7 +9,7 @@ from typing import cast
 import jsonargparse
 import pixpy as pix
 from lagom import Container
-from openai import OpenAI
+from openai import DEFAULT_CONNECTION_LIMITS, DefaultHttpxClient, OpenAI
 from pixtools import ImageGen, OpenAIClient, TextToSpeech
 from pixtools.audio_player import AudioPlayer
 from pixtools.cache import FileCache
@@ -61,7 +62,7 @@ def main():
         ),
     )
 
-    print(args.prompts)
+    logger.debug(f"Prompts: {args.prompts}")
 
     # Initialize pixpy rendering components
     screen = (
@@ -82,7 +83,11 @@ def main():
     if key_path.exists():
         with open(key_path) as f:
             api_key = f.read().strip()
-    client = OpenAI(api_key=api_key)
+    # Keep idle connections around between turns, so speech and transcription
+    # requests after a pause reuse the connection instead of a new TLS handshake
+    limits = copy.copy(DEFAULT_CONNECTION_LIMITS)
+    limits.keepalive_expiry = 120
+    client = OpenAI(api_key=api_key, http_client=DefaultHttpxClient(limits=limits))
     container[OpenAI] = client
 
     img_cache = FileCache(Path(".cache/img"))
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 from collections.abc import Callable
 from importlib import resources
+from logging import getLogger
 from typing import Final
 
 import pixpy as pix
@@ -12,6 +13,8 @@ from .talkie_config import TalkieConfig
 from .utils.nerd import Nerd
 from .utils.wrap import wrap_lines
 
+logger = getLogger(__name__)
+
 
 class Drawable:
     def __init__(
@@ -46,9 +49,9 @@ class Talkie:
         data = resources.files("talkie.data")
         font_path = config.text_font or data / "3270.ttf"
         tile_set = pix.TileSet(font_file=str(font_path), size=config.text_size)
-        print(tile_set.tile_size)
+        logger.debug(f"Tile size: {tile_set.tile_size}")
 
-        print(config.layout)
+        logger.debug(f"Layout: {config.layout}")
         layout = Layout(config.layout)
         fh = 0 if config.inline_input else tile_set.tile_size.y
         layout.set_size("input", height=fh)
@@ -59,7 +62,7 @@ class Talkie:
 
         for r in self.rects:
             self.items[r.name] = r
-            print(r)
+            logger.debug(r)
 
         self.border = pix.Float2(config.border_size, config.border_size)
 
@@ -241,7 +244,6 @@ class Talkie:
             if isinstance(e, pix.event.Key):
                 self.current_image = None
                 if e.key < 0x1000 and self.ai_player.key_mode():
-                    print("KEY")
                     self.ai_player.write_command(chr(e.key))
 
             if isinstance(e, pix.event.Text):
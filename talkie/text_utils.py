@@ -1,37 +1,48 @@
 import re
+from functools import lru_cache
 
 
-def parse_text(text: str, patterns: dict[str, str]) -> dict[str, str]:
+@lru_cache(maxsize=256)
+def _compile(pattern: str) -> re.Pattern[str]:
+    """Compile a `parse_text` pattern once and reuse it across calls."""
+    return re.compile(pattern, re.MULTILINE)
+
+
+def parse_text(
+    text: str,
+    patterns: dict[str, str] | dict[str, re.Pattern[str]],
+    required: dict[str, str] | None = None,
+) -> dict[str, str]:
     """Parse a description by matching named regex patterns and removing matches from text.
 
     Args:
         text: The input text to parse
-        patterns: Dict mapping names to regex patterns
+        patterns: Dict mapping names to regex patterns, either as strings
+            (compiled with re.MULTILINE) or as precompiled patterns
+        required: Optional dict mapping names to a literal substring that any
+            match of that pattern contains. The regex is skipped when the
+            literal is not in the text.
 
     Returns:
         Dict with 'text' key containing remaining text and other keys for named matches
     """
     result: dict[str, str] = {}
     remaining_text = text
+    required = required or {}
 
     for name, pattern in patterns.items():
+        literal = required.get(name)
+        if literal is not None and literal not in remaining_text:
+            result[name] = ""
+            continue
+        if isinstance(pattern, str):
+            pattern = _compile(pattern)
         # Find all matches first
-        matches = list(re.finditer(pattern, remaining_text, re.MULTILINE))
+        matches = list(pattern.finditer(remaining_text))
         if matches:
             # Store the first match for the result
             result[name] = matches[0].group(0)
-            # Remove all occurrences by iterating through them in reverse order
-            # (to avoid index shifting issues)
-            for match in reversed(matches):
-                match_text = match.group(0)
-                # Include trailing newline if it exists to avoid double newlines
-                start, end = match.start(), match.end()
-                if end < len(remaining_text) and remaining_text[end] == "\n":
-                    match_text += "\n"
-                remaining_text = (
-                    remaining_text[:start] + remaining_text[start + len(match_text) :]
-                )
-            remaining_text = remaining_text.strip()
+            remaining_text = _remove_matches(remaining_text, matches).strip()
         else:
             result[name] = ""
 
@@ -39,20 +50,81 @@ def parse_text(text: str, patterns: dict[str, str]) -> dict[str, str]:
     return result
 
 
+def _remove_matches(text: str, matches: list[re.Match[str]]) -> str:
+    """Remove all `matches` from `text`, building the result in a single join.
+
+    A newline directly following a match is removed together with it to avoid
+    double newlines. Matches are resolved from the last one backwards, so for
+    a match that touches the next one, "directly following" refers to the
+    first character left after that next match is gone.
+    """
+    # Removed [start, end) intervals, collected from right to left. Touching
+    # intervals are kept merged, so the end of the last one is the first
+    # character left after the current match.
+    removed: list[list[int]] = []
+    for match in reversed(matches):
+        start, end = match.span()
+        if removed and removed[-1][0] == end:
+            removed[-1][0] = start
+        else:
+            removed.append([start, end])
+        interval = removed[-1]
+        if interval[1] < len(text) and text[interval[1]] == "\n":
+            interval[1] += 1
+            if len(removed) > 1 and removed[-2][0] == interval[1]:
+                interval[1] = removed[-2][1]
+                del removed[-2]
+
+    pieces: list[str] = []
+    pos = 0
+    for start, end in reversed(removed):
+        pieces.append(text[pos:start])
+        pos = end
+    pieces.append(text[pos:])
+    return "".join(pieces)
+
+
+_ADVENTURE_PATTERNS = {
+    name: re.compile(pattern, re.MULTILINE)
+    for name, pattern in {
+        "title": r"^(.*)\ {5,}(.*)$",
+        "title2": r"^\ {5,}(.*)\w$",
+        "header": r"^Using normal.*\nLoading.*$",
+        "trademark": r"^.*trademark.*nfocom.*$",
+        "release": r"^Release.*Serial.*$",
+        "warning": r"^Warning:.*$",
+        "prompt": r"\n+>",
+        "copyright": r"^Copyright (.*)$",
+    }.items()
+}
+
+# A literal that every match of the corresponding pattern contains
+_ADVENTURE_REQUIRED = {
+    "title": "     ",
+    "title2": "     ",
+    "header": "Using normal",
+    "trademark": "trademark",
+    "release": "Release",
+    "warning": "Warning:",
+    "prompt": "\n>",
+    "copyright": "Copyright ",
+}
+
+
 def parse_adventure_description(text: str) -> dict[str, str]:
-    return parse_text(
-        text,
-        {
-            "title": r"^(.*)\ {5,}(.*)$",
-            "title2": r"^\ {5,}(.*)\w$",
-            "header": r"^Using normal.*\nLoading.*$",
-            "trademark": r"^.*trademark.*nfocom.*$",
-            "release": r"^Release.*Serial.*$",
-            "warning": r"^Warning:.*$",
-            "prompt": r"\n+>",
-            "copyright": r"^Copyright (.*)$",
-        },
-    )
+    """Split interpreter output into title, copyright, prompt etc. and the game text.
+
+    Results are memoized by input text; each call returns a fresh dict.
+    """
+    return dict(_parse_adventure_description(text))
+
+
+@lru_cache(maxsize=256)
+def _parse_adventure_description(text: str) -> dict[str, str]:
+    return parse_text(text, _ADVENTURE_PATTERNS, _ADVENTURE_REQUIRED)
+
+
+_LINE_END = re.compile(r"[.?!>:]$")
 
 
 def unwrap_text(text: str, colum: int = 200) -> str:
@@ -60,20 +132,22 @@ def unwrap_text(text: str, colum: int = 200) -> str:
     Try to unwrap wrapped text. Assumes any line that is longer than 'column' and does not end in punctuation should be joined with the next line.
     """
 
-    pattern = re.compile(r"[.?!>:]$")
     new_lines: list[str] = []
-    last_line: str = ""
+    # Lines waiting to be joined, collected in a list to avoid repeated concat
+    pending: list[str] = []
     for line in text.splitlines():
-        if len(line) > colum and not pattern.search(line):
-            last_line = last_line + " " + line if last_line != "" else line
+        if len(line) > colum and not _LINE_END.search(line):
+            if pending or line:
+                pending.append(line)
         else:
-            if last_line != "":
-                new_lines.append(last_line + " " + line)
-                last_line = ""
+            if pending:
+                pending.append(line)
+                new_lines.append(" ".join(pending))
+                pending = []
             else:
                 new_lines.append(line)
-    if last_line != "":
-        new_lines.append(last_line)
+    if pending:
+        new_lines.append(" ".join(pending))
 
     return "\n".join(new_lines)
 
@@ -84,6 +158,12 @@ def trim_lines(text: str) -> str:
     return "\n".join(lines)
 
 
+# Splitters used by partition_text, from coarsest to finest
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_SENTENCE_LINE_END = re.compile(r"([.!?]\n)")
+_SENTENCE_END = re.compile(r"([.!?])")
+
+
 def partition_text(text: str, max_len: int) -> list[str]:
     """Split text into chunks of maximum length, using intelligent splitting.
 
@@ -101,7 +181,7 @@ def partition_text(text: str, max_len: int) -> list[str]:
         return [text]
 
     # First, split on empty lines (double linefeeds)
-    paragraphs = re.split(r"\n\s*\n", text)
+    paragraphs = _PARAGRAPH_BREAK.split(text)
 
     result: list[str] = []
     for paragraph in paragraphs:
@@ -120,7 +200,7 @@ def _split_paragraph(text: str, max_len: int) -> list[str]:
         return [text]
 
     # Try splitting on sentence ending + linefeed first
-    sentences = re.split(r"([.!?]\n)", text)
+    sentences = _SENTENCE_LINE_END.split(text)
     if len(sentences) > 1:
         # Rejoin split parts with their delimiters
         rejoined: list[str] = []
@@ -165,7 +245,7 @@ def _split_by_sentence_end(text: str, max_len: int) -> list[str]:
         return [text]
 
     # Split on sentence endings anywhere
-    sentences = re.split(r"([.!?])", text)
+    sentences = _SENTENCE_END.split(text)
     # Rejoin split parts with their delimiters
     sentences = ["".join(sentences[i : i + 2]) for i in range(0, len(sentences), 2)]
 
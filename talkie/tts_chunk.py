@@ -8,6 +8,7 @@ an absolute last resort.
 
 Usage:
     chunks = split_for_tts(long_text, max_chars=3000)
+    chunks = pack_paragraphs_for_tts(paragraphs, max_chars=400)
 
 Notes:
 - The default `max_chars` value aims to stay well within typical TTS input
@@ -19,6 +20,7 @@ Notes:
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
 from typing import Final
 
 # Ordered breakpoint strategies, evaluated from strongest to weakest.
@@ -137,4 +139,47 @@ def split_for_tts(text: str, *, max_chars: int = 3000) -> list[str]:
     return out
 
 
-__all__ = ["split_for_tts"]
+def pack_paragraphs_for_tts(
+    paragraphs: Iterable[str], *, max_chars: int = 3000
+) -> list[str]:
+    """Pack whole paragraphs into TTS-friendly chunks.
+
+    Consecutive paragraphs are joined with a blank line while they fit within
+    `max_chars`, so chunks start and end on paragraph boundaries and the text
+    of a chunk does not depend on where a longer text happened to be cut. A
+    paragraph that is longer than `max_chars` by itself is split with
+    `split_for_tts`.
+
+    Args:
+        paragraphs: The paragraphs to pack, in order. Empty ones are skipped.
+        max_chars: Maximum characters per chunk (hard cap).
+
+    Returns:
+        List of non-empty chunks, each length <= `max_chars`.
+    """
+    out: list[str] = []
+    current = ""
+
+    for paragraph in paragraphs:
+        paragraph = _coalesce_whitespace(paragraph)
+        if not paragraph:
+            continue
+
+        if len(paragraph) > max_chars:
+            if current:
+                out.append(current)
+                current = ""
+            out.extend(split_for_tts(paragraph, max_chars=max_chars))
+        elif current and len(current) + 2 + len(paragraph) <= max_chars:
+            current += "\n\n" + paragraph
+        else:
+            if current:
+                out.append(current)
+            current = paragraph
+
+    if current:
+        out.append(current)
+    return out
+
+
+__all__ = ["pack_paragraphs_for_tts", "split_for_tts"]
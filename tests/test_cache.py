@@ -1,6 +1,4 @@
 import json
-import shutil
-import tempfile
 import time
 from pathlib import Path
 
@@ -8,14 +6,17 @@ import pytest
 from pixtools.cache import FileCache
 
 
+@pytest.fixture(scope="session")
+def shared_cache(tmp_path_factory: pytest.TempPathFactory):
+    """Create a single cache directory shared by all tests in the session."""
+    return FileCache(cache_dir=tmp_path_factory.mktemp("cache"), max_files=3)
+
+
 @pytest.fixture
-def temp_cache():
-    """Create a temporary cache directory for testing."""
-    temp_dir = tempfile.mkdtemp()
-    cache = FileCache(cache_dir=temp_dir, max_files=3)
-    yield cache
-    # Cleanup
-    shutil.rmtree(temp_dir)
+def temp_cache(shared_cache: FileCache):
+    """Provide the shared cache, emptied before each test."""
+    shared_cache.clear()
+    yield shared_cache
 
 
 class TestFileCache:
@@ -141,20 +142,20 @@ class TestFileCache:
         assert temp_cache.exists("key3")
         assert temp_cache.exists("key4")
 
-    def test_binary_data_handling(self, temp_cache: FileCache):
-        """Test handling of various binary data types."""
-        # Test with different types of binary data
-        test_cases = [
+    @pytest.mark.parametrize(
+        "key,data",
+        [
             ("text", b"Hello, World!"),
             ("empty", b""),
             ("binary", bytes([0, 1, 255, 128, 64])),
             ("unicode", "🌟 Unicode! 🚀".encode()),
-        ]
-
-        for key, data in test_cases:
-            temp_cache.add(key, data)
-            retrieved = temp_cache.get(key)
-            assert retrieved == data
+        ],
+    )
+    def test_binary_data_handling(self, temp_cache: FileCache, key: str, data: bytes):
+        """Test handling of various binary data types."""
+        temp_cache.add(key, data)
+        retrieved = temp_cache.get(key)
+        assert retrieved == data
 
     def test_key_collision_safety(self, temp_cache: FileCache):
         """Test that different keys don't collide even with similar content."""
@@ -168,34 +169,28 @@ class TestFileCache:
         assert not temp_cache.exists("key1")
         assert temp_cache.exists("key2")
 
-    def test_persistence_across_instances(self):
+    def test_persistence_across_instances(self, tmp_path: Path):
         """Test that cache files persist on disk across FileCache instances."""
-        temp_dir = tempfile.mkdtemp()
-
-        try:
-            # Create first cache instance and add data
-            cache1 = FileCache(cache_dir=temp_dir, max_files=100)
-            cache1.add("persistent_key", b"persistent_data")
-
-            # Verify file exists on disk
-            cache_files = list(Path(temp_dir).glob("*.json"))
-            assert len(cache_files) == 1
-
-            # Create second cache instance and verify data can still be retrieved
-            cache2 = FileCache(cache_dir=temp_dir, max_files=100)
-            data = cache2.get("persistent_key")
-
-            assert data == b"persistent_data"
-            assert cache2.exists("persistent_key")
-            # Note: size() will be 0 initially since we don't load existing files on startup
-            # but the data is still accessible via get()
-
-        finally:
-            shutil.rmtree(temp_dir)
-
-    def test_special_characters_in_keys(self, temp_cache: FileCache):
-        """Test handling of special characters in keys."""
-        special_keys = [
+        # Create first cache instance and add data
+        cache1 = FileCache(cache_dir=tmp_path, max_files=100)
+        cache1.add("persistent_key", b"persistent_data")
+
+        # Verify file exists on disk
+        cache_files = list(tmp_path.glob("*.json"))
+        assert len(cache_files) == 1
+
+        # Create second cache instance and verify data can still be retrieved
+        cache2 = FileCache(cache_dir=tmp_path, max_files=100)
+        data = cache2.get("persistent_key")
+
+        assert data == b"persistent_data"
+        assert cache2.exists("persistent_key")
+        # Note: size() will be 0 initially since we don't load existing files on startup
+        # but the data is still accessible via get()
+
+    @pytest.mark.parametrize(
+        "key",
+        [
             "key with spaces",
             "key/with/slashes",
             "key\\with\\backslashes",
@@ -203,35 +198,29 @@ class TestFileCache:
             "key|with|pipes",
             "key<with>brackets",
             'key"with"quotes',
-        ]
-
-        for key in special_keys:
-            data = f"data for {key}".encode()
-            temp_cache.add(key, data)
-            retrieved = temp_cache.get(key)
-            assert retrieved == data
+        ],
+    )
+    def test_special_characters_in_keys(self, temp_cache: FileCache, key: str):
+        """Test handling of special characters in keys."""
+        data = f"data for {key}".encode()
+        temp_cache.add(key, data)
+        retrieved = temp_cache.get(key)
+        assert retrieved == data
 
-    def test_constructor_metadata(self, temp_cache: FileCache):
+    def test_constructor_metadata(self, tmp_path: Path):
         """Test metadata set at constructor level."""
-        temp_dir = tempfile.mkdtemp()
-        try:
-            cache = FileCache(
-                cache_dir=temp_dir, meta={"version": "1.0", "source": "test"}
-            )
+        cache = FileCache(cache_dir=tmp_path, meta={"version": "1.0", "source": "test"})
 
-            # Add data without method-level metadata
-            cache.add("key1", b"data1")
+        # Add data without method-level metadata
+        cache.add("key1", b"data1")
 
-            # Should be able to retrieve with same constructor metadata
-            assert cache.get("key1") == b"data1"
-            assert cache.exists("key1")
+        # Should be able to retrieve with same constructor metadata
+        assert cache.get("key1") == b"data1"
+        assert cache.exists("key1")
 
-            # Should not be retrievable with different metadata
-            assert cache.get("key1", {"version": "2.0"}) is None
-            assert not cache.exists("key1", {"version": "2.0"})
-
-        finally:
-            shutil.rmtree(temp_dir)
+        # Should not be retrievable with different metadata
+        assert cache.get("key1", {"version": "2.0"}) is None
+        assert not cache.exists("key1", {"version": "2.0"})
 
     def test_method_metadata(self, temp_cache: FileCache):
         """Test metadata passed to individual methods."""
@@ -252,31 +241,24 @@ class TestFileCache:
         assert not temp_cache.exists(key)
         assert not temp_cache.exists(key, {"user": "bob"})
 
-    def test_metadata_merging(self, temp_cache: FileCache):
+    def test_metadata_merging(self, tmp_path: Path):
         """Test that method metadata overrides constructor metadata."""
-        temp_dir = tempfile.mkdtemp()
-        try:
-            cache = FileCache(
-                cache_dir=temp_dir, meta={"version": "1.0", "env": "test"}
-            )
-
-            key = "merge_key"
-            data = b"merge data"
-            method_meta = {"env": "prod", "user": "alice"}  # env overrides constructor
+        cache = FileCache(cache_dir=tmp_path, meta={"version": "1.0", "env": "test"})
 
-            # Add with method metadata that overrides constructor
-            cache.add(key, data, method_meta)
+        key = "merge_key"
+        data = b"merge data"
+        method_meta = {"env": "prod", "user": "alice"}  # env overrides constructor
 
-            # Expected merged metadata: {"version": "1.0", "env": "prod", "user": "alice"}
-            expected_meta = {"version": "1.0", "env": "prod", "user": "alice"}
-            assert cache.get(key, method_meta) == data
-            assert cache.exists(key, method_meta)
+        # Add with method metadata that overrides constructor
+        cache.add(key, data, method_meta)
 
-            # Should not retrieve with just constructor metadata
-            assert cache.get(key) is None
+        # Expected merged metadata: {"version": "1.0", "env": "prod", "user": "alice"}
+        expected_meta = {"version": "1.0", "env": "prod", "user": "alice"}
+        assert cache.get(key, method_meta) == data
+        assert cache.exists(key, method_meta)
 
-        finally:
-            shutil.rmtree(temp_dir)
+        # Should not retrieve with just constructor metadata
+        assert cache.get(key) is None
 
     def test_metadata_creates_different_cache_entries(self, temp_cache: FileCache):
         """Test that same key with different metadata creates different entries."""
@@ -370,22 +352,17 @@ class TestFileCache:
         cache_data = json.loads(file_path.read_text())
         assert "meta" not in cache_data
 
-    def test_metadata_with_constructor_and_empty_method(self, temp_cache: FileCache):
+    def test_metadata_with_constructor_and_empty_method(self, tmp_path: Path):
         """Test constructor metadata with empty method metadata."""
-        temp_dir = tempfile.mkdtemp()
-        try:
-            cache = FileCache(cache_dir=temp_dir, meta={"version": "1.0"})
-
-            key = "test_key"
-            data = b"test data"
+        cache = FileCache(cache_dir=tmp_path, meta={"version": "1.0"})
 
-            # Add with empty method metadata - should use constructor metadata
-            cache.add(key, data, {})
+        key = "test_key"
+        data = b"test data"
 
-            # Should retrieve with constructor metadata
-            assert cache.get(key) == data
-            assert cache.get(key, {}) == data
-            assert cache.exists(key)
+        # Add with empty method metadata - should use constructor metadata
+        cache.add(key, data, {})
 
-        finally:
-            shutil.rmtree(temp_dir)
+        # Should retrieve with constructor metadata
+        assert cache.get(key) == data
+        assert cache.get(key, {}) == data
+        assert cache.exists(key)
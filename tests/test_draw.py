@@ -19,6 +19,83 @@ class TestDraw(unittest.TestCase):
                 else:
                     self.assertEqual(canvas.array[idx], 0)
 
+    def test_draw_line_axis_aligned_clipped(self):
+        w, h = 5, 4
+        canvas = PixelCanvas(w, h)
+
+        canvas.draw_line(-3, 1, 2, 1, 1)  # horizontal, starts off-canvas
+        canvas.draw_line(4, 9, 4, 2, 2)  # vertical, reversed and off-canvas
+        canvas.draw_line(0, 7, 4, 7, 3)  # fully outside
+
+        for y in range(h):
+            for x in range(w):
+                if y == 1 and x <= 2:
+                    expected = 1
+                elif x == 4 and y >= 2:
+                    expected = 2
+                else:
+                    expected = 0
+                self.assertEqual(canvas.array[y * w + x], expected)
+
+    def test_draw_line_diagonal_partly_off_canvas(self):
+        w, h = 5, 4
+        canvas = PixelCanvas(w, h)
+
+        canvas.draw_line(-2, -2, 6, 6, 1)
+        canvas.draw_line(5, -1, 0, 4, 2)  # anti-diagonal, drawn second
+
+        for y in range(h):
+            for x in range(w):
+                if x + y == 4:
+                    expected = 2
+                elif x == y:
+                    expected = 1
+                else:
+                    expected = 0
+                self.assertEqual(canvas.array[y * w + x], expected)
+
+    def test_draw_line_beyond_same_edge(self):
+        w, h = 5, 4
+        canvas = PixelCanvas(w, h)
+
+        canvas.draw_line(-5, 0, -1, 3, 1)  # left
+        canvas.draw_line(5, 1, 9, 3, 1)  # right
+        canvas.draw_line(0, -4, 4, -1, 1)  # above
+        canvas.draw_line(1, 4, 3, 8, 1)  # below
+
+        self.assertTrue(all(p == 0 for p in canvas.array))
+
+    def test_draw_line_target_color(self):
+        w = h = 5
+        canvas = PixelCanvas(w, h)
+        canvas.draw_line(0, 2, 4, 2, 3)
+
+        # Only the pixel already in the target color is drawn
+        canvas.draw_line(0, 0, 4, 4, 1, target_color=3)
+        # The crossing pixel is no longer 0, so it is left alone
+        canvas.draw_line(4, 0, 0, 4, 2, target_color=0)
+
+        for y in range(h):
+            for x in range(w):
+                if (x, y) == (2, 2):
+                    expected = 1
+                elif x + y == 4:
+                    expected = 2
+                elif y == 2:
+                    expected = 3
+                else:
+                    expected = 0
+                self.assertEqual(canvas.array[y * w + x], expected)
+
+    def test_clear(self):
+        canvas = PixelCanvas(4, 3)
+        canvas.draw_line(0, 0, 3, 2, 1)
+
+        canvas.clear(7)
+
+        self.assertEqual(len(canvas.array), 12)
+        self.assertTrue(all(p == 7 for p in canvas.array))
+
     def test_flood_fill_enclosed_area(self):
         w = h = 5
         canvas = PixelCanvas(w, h)
@@ -55,5 +132,71 @@ class TestDraw(unittest.TestCase):
                 self.assertEqual(at(x, y), 0)
 
 
+    def test_flood_fill_regex_special_target(self):
+        w = h = 5
+        # Newline, ".", "+", "*" and backslash have a meaning in a regex
+        for target in (10, 42, 43, 46, 92):
+            with self.subTest(target=target):
+                canvas = PixelCanvas(w, h)
+                canvas.clear(target)
+                canvas.draw_line(1, 1, 3, 1, 2)
+                canvas.draw_line(1, 3, 3, 3, 2)
+                canvas.draw_line(1, 1, 1, 3, 2)
+                canvas.draw_line(3, 1, 3, 3, 2)
+
+                canvas.flood_fill(2, 2, 5, target)
+
+                self.assertEqual(canvas.array[2 * w + 2], 5)
+                self.assertEqual(canvas.array.count(5), 1)
+                self.assertEqual(canvas.array.count(target), w * h - 9)
+
+    def test_flood_fill_full_width_rows(self):
+        w, h = 6, 4
+        canvas = PixelCanvas(w, h)
+        canvas.draw_line(0, 1, w - 1, 1, 2)  # wall across the whole canvas
+
+        # Spans reach both row ends but must not wrap into the next row
+        canvas.flood_fill(3, 0, 5, 0)
+        canvas.flood_fill(w - 1, 2, 6, 0)
+
+        for y in range(h):
+            expected = [5, 2, 6, 6][y]
+            for x in range(w):
+                self.assertEqual(canvas.array[y * w + x], expected)
+
+    def test_flood_fill_does_not_wrap_rows(self):
+        w = 4
+        # The end of row 0 and the start of row 1 are adjacent in the buffer
+        # but not connected on the canvas
+        layout = [2, 0, 0, 0, 0, 2, 2, 2]
+        for seed, expected in (
+            ((2, 0), [2, 5, 5, 5, 0, 2, 2, 2]),
+            ((0, 1), [2, 0, 0, 0, 5, 2, 2, 2]),
+        ):
+            with self.subTest(seed=seed):
+                canvas = PixelCanvas(w, 2)
+                canvas.set_pixels(layout)
+
+                canvas.flood_fill(*seed, 5, 0)
+
+                self.assertEqual(list(canvas.array), expected)
+
+    def test_flood_fill_separate_runs_on_neighbouring_row(self):
+        w, h = 7, 4
+        canvas = PixelCanvas(w, h)
+        for x in (1, 3, 5):
+            canvas.draw_line(x, 1, x, 1, 2)  # row 1 has four separate runs
+        canvas.draw_line(0, 3, w - 1, 3, 2)
+
+        canvas.flood_fill(3, 0, 5, 0)
+
+        for y in range(h):
+            for x in range(w):
+                if y == 3 or (y == 1 and x % 2 == 1):
+                    expected = 2
+                else:
+                    expected = 5
+                self.assertEqual(canvas.array[y * w + x], expected)
+
 if __name__ == "__main__":
     unittest.main()
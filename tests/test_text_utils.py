@@ -1,3 +1,4 @@
+import re
 import unittest
 
 from talkie.text_utils import parse_adventure_description, parse_text, unwrap_text, partition_text
@@ -36,6 +37,44 @@ class TestTextUtils(unittest.TestCase):
         self.assertEqual(result["location"], "Location: forest")
         self.assertEqual(result["text"], "Player")
 
+    def test_parse_text_removes_trailing_newlines(self):
+        result = parse_text("a\nb\nc\n>\n>\nd", {"ab": r"^[ab]$", "prompt": r"\n+>"})
+
+        self.assertEqual(result["ab"], "a")
+        self.assertEqual(result["prompt"], "\n>")
+        self.assertEqual(result["text"], "cd")
+
+    def test_parse_text_required_literal_absent(self):
+        # The regex would match, but without its literal it is not even tried
+        text = "Score: 42 in the forest"
+        result = parse_text(text, {"score": r"Score: \d+"}, {"score": "Points:"})
+
+        self.assertEqual(result["score"], "")
+        self.assertEqual(result["text"], text)
+
+    def test_parse_text_required_literal_present_without_match(self):
+        text = "Score: none yet"
+        result = parse_text(text, {"score": r"Score: \d+"}, {"score": "Score:"})
+
+        self.assertEqual(result["score"], "")
+        self.assertEqual(result["text"], text)
+
+    def test_parse_text_many_adjacent_matches(self):
+        text = "Room\n" + "\n>" * 5000 + "\nend"
+        # Reference: remove matches one at a time from the end, as parse_text
+        # originally did
+        expected = text
+        for match in reversed(list(re.finditer(r"\n+>", text))):
+            start, end = match.span()
+            if end < len(expected) and expected[end] == "\n":
+                end += 1
+            expected = expected[:start] + expected[end:]
+
+        result = parse_text(text, {"prompt": r"\n+>"})
+
+        self.assertEqual(result["prompt"], "\n\n>")
+        self.assertEqual(result["text"], expected.strip())
+
     def test_parse_adventure_description_with_title(self):
         text = (
             "DEADLINE     An Interactive Fiction by Marc Blank\nCopyright 1982 Infocom"
@@ -66,6 +105,14 @@ class TestTextUtils(unittest.TestCase):
             result["text"], "Just a regular game description without special formatting"
         )
 
+    def test_parse_adventure_description_returns_fresh_dict(self):
+        text = "Some game description\nCopyright 1985 Game Company"
+        first = parse_adventure_description(text)
+        first["text"] = "changed"
+
+        second = parse_adventure_description(text)
+        self.assertEqual(second["text"], "Some game description")
+
     def test_real_game(self):
         text = "Using normal formatting.\nLoading ./deadline.z3.\n South Lawn                                                 Time:  8:00 am\n\nDEADLINE: An INTERLOGIC Mystery\nCopyright 1982 by Infocom, Inc. All rights reserved.\nDEADLINE and INTERLOGIC are trademarks of Infocom, Inc.\nRelease 27 / Serial number 831005\n\nSouth Lawn\nYou are on a wide lawn just north of the entrance to the Robner estate. Directly\nnorth at the end of a pebbled path is the Robner house, flanked to the northeast\nand northwest by a vast expanse of well-kept lawn. Beyond the house can be seen\nthe lakefront.\n\n>"
         result = parse_adventure_description(text)
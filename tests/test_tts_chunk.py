@@ -1,6 +1,6 @@
 import pytest
 
-from talkie.tts_chunk import split_for_tts
+from talkie.tts_chunk import pack_paragraphs_for_tts, split_for_tts
 
 
 def assert_all_leq(chunks: list[str], max_chars: int) -> None:
@@ -67,3 +67,30 @@ def test_greedy_packing_under_limit() -> None:
     # Greedy packing: first chunk should contain more than one sentence if possible
     assert any(c.count(".") >= 2 for c in chunks)
 
+
+def test_pack_paragraphs_keeps_paragraph_boundaries() -> None:
+    paragraphs = [
+        "West of House",
+        "You are standing in an open field west of a white house, with a "
+        "boarded front door. There is a small mailbox here.",
+        "A battered lantern lies on the ground, its glass cracked. Beside it "
+        "someone has dropped a leaflet. The wind tugs at its corners.",
+        "A rusty key is half buried in the mud near the path leading north "
+        "into the forest. It looks like it has been here for a long time.",
+    ] * 2
+    chunks = pack_paragraphs_for_tts(paragraphs, max_chars=400)
+    assert_all_leq(chunks, 400)
+    assert len(chunks) < len(paragraphs)
+    # Every chunk is a run of whole paragraphs, in the original order
+    assert [p for c in chunks for p in c.split("\n\n")] == paragraphs
+
+
+def test_pack_paragraphs_splits_only_oversized_paragraph() -> None:
+    long_para = "This sentence is long enough. " * 5
+    paragraphs = ["Short one.", long_para, "", "Tail."]
+    chunks = pack_paragraphs_for_tts(paragraphs, max_chars=60)
+    assert_all_leq(chunks, 60)
+    assert chunks[0] == "Short one."
+    assert chunks[-1] == "Tail."
+    assert " ".join(chunks[1:-1]) == long_para.strip()
+